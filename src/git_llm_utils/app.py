@@ -2,9 +2,11 @@ from enum import Enum
 from io import StringIO
 from git_llm_utils.utils import (
     _bool,
+    batch_stream,
     get_tomlib_project,
     read_version,
     read_file,
+    read_file_cached,
     write_file,
     execute_command,
     execute_raw_command,
@@ -12,6 +14,7 @@ from git_llm_utils.utils import (
 )
 from git_llm_utils.git import (
     get_config as _get_config,
+    get_configs as _get_configs,
     get_staged_changes,
     get_repository_path,
     request_message_edit,
@@ -19,17 +22,15 @@ from git_llm_utils.git import (
     unset_config,
     Scope,
 )
-from git_llm_utils.llm import LLMClient
+from dataclasses import dataclass
 from os import environ
 from pathlib import Path
-from pydantic import BaseModel
-from rich.console import Console
-from rich.table import Table
-from rich.markdown import Markdown
 from typing import Any, Callable, Optional, TextIO, Tuple
 
 
+import functools
 import sys
+import threading
 import typer
 
 OVERRIDE = "GIT_LLM_ON"
@@ -39,34 +40,66 @@ COMMIT_COMMAND = ["git", "commit", "-F", "-"]
 MESSAGE_HOOK = "prepare-commit-msg"
 MESSAGE_HOOK_TEMPLATE = f"{MESSAGE_HOOK}.template"
 NO_CHANGES_MESSAGE = 'no changes added to commit (use "git add" and/or "git commit -a")'
+_CWD = Path(".")  # reused instead of rebuilding a Path per call
 
 
-class SettingLoader(BaseModel):
+# a plain slotted dataclass keeps pydantic off the startup import path
+@dataclass(slots=True)
+class SettingLoader:
     name: str
     key: str
-    factory: Any | None  # the code value
-    config: Any | None  # the current config value
-    value: Any | None  # the cli value
-    hint: str | None
+    factory: Any | None = None  # the code value
+    config: Any | None = None  # the current config value
+    value: Any | None = None  # the cli value
+    hint: str | None = None
     bool_hint: str | None = "with-"
     parser: Callable[[str], Any] | Any = None
+    is_bool: bool = False  # computed once instead of comparing parsers per call
+    loaded: bool = False
+    help_template: str | None = None
 
-    def load_config(self, scope: Optional[Scope] = None) -> Tuple[Any, str]:
-        self.config = _get_config(
-            self.key,
-            default_value=self.factory,
-            repository=Runtime.repository,
-            scope=scope,
+    def __post_init__(self):
+        self.is_bool = self.parser is _bool
+
+    def describe(self) -> str:
+        if self.help_template is None:  # only the default varies between calls
+            self.help_template = (
+                f"{self.hint} [bold green]\\[default: {{default}}][/bold green]"
+            )
+        # falsy configured values (false, 0, "") must still win over the factory
+        default = (
+            self.config if self.loaded and self.config is not None else self.factory
         )
-        if self.config is not None and self.parser:
-            self.config = self.parser(self.config)
-        if self.parser == _bool:
-            help = f"{self.hint} [bold green]\\[default: {_bool(str(self.config)) and f'--{self.bool_hint}' or f'--no-{self.bool_hint}'}{self.name}][/bold green]"
+        if self.is_bool:
+            default = (
+                _bool(str(default))
+                and f"--{self.bool_hint}{self.name}"
+                or f"--no-{self.bool_hint}{self.name}"
+            )
+        return self.help_template.format(default=default)
+
+    def load_config(self, scope: Optional[Scope] = None) -> Tuple[Any, str]:
+        if scope is None:  # the scopeless values are read in a single git call
+            value = Runtime.load_configs().get(self.key)
+            self.config = value if value is not None else self.factory
         else:
-            help = (
-                f"{self.hint} [bold green]\\[default: {str(self.config)}][/bold green]"
+            self.config = _get_config(
+                self.key,
+                default_value=self.factory,
+                repository=Runtime.repository,
+                scope=scope,
             )
-        return (self.config, help)
+        if self.config is not None and self.parser:
+            try:
+                self.config = self.parser(self.config)
+            except (TypeError, ValueError) as e:
+                ErrorHandler.report_error(
+                    f"Invalid {self.key} value {self.config!r}, using {self.factory}: {e}",
+                    show=True,
+                )
+                self.config = self.factory
+        self.loaded = True
+        return (self.config, self.describe())
 
     def set_value(self, value: Any):
         if self.parser is None or value is None:
@@ -79,23 +112,55 @@ class SettingLoader(BaseModel):
             return given
         if self.value is not None:
             return self.value
+        if not self.loaded:  # defer the git read until a value is needed
+            self.load_config()
         if self.config is not None:
             return self.config
         return self.factory
 
 
-class Runtime:
-    repository: Optional[Path] = get_repository_path(abort_on_error=False)
+_UNSET = object()
+
+
+class _RuntimeMeta(type):
+    @property
+    def repository(cls) -> Optional[Path]:
+        # the git probe is deferred until a command actually needs the path
+        if cls._repository is _UNSET:
+            cls._repository = get_repository_path(abort_on_error=False)
+        return cls._repository
+
+    @repository.setter
+    def repository(cls, value: Optional[Path]):
+        cls._repository = value
+
+
+class Runtime(metaclass=_RuntimeMeta):
+    _repository: Any = _UNSET
     confirm: bool = True
     settings: dict[str, Tuple[SettingLoader, typer.models.OptionInfo]] = {}
 
+    @staticmethod
+    def load_configs() -> dict[str, str]:
+        return _get_configs(repository=Runtime.repository)
+
+    @staticmethod
+    def refresh_settings():
+        for loader, option in Runtime.settings.values():
+            (option.default, option.help) = loader.load_config()
+
+    @staticmethod
+    def invalidate_settings():
+        # mark the loaders stale, the reload happens on first read
+        for loader, _ in Runtime.settings.values():
+            loader.loaded = False
+
     @staticmethod
     def _set_repository(repository: str):
         previous = Runtime.repository
         Runtime.repository = get_repository_path(repository=repository)
         if previous != Runtime.repository:
-            for loader, option in Runtime.settings.values():
-                (option.default, option.help) = loader.load_config()
+            Runtime.invalidate_settings()
         return Runtime.repository
 
     @staticmethod
@@ -128,14 +193,13 @@ class Runtime:
             bool_hint=bool_hint,
             parser=parser,
         )
-        (_, help) = loader.load_config()
         option = typer.Option(  # type: ignore
             default=None,
-            help=help,
+            help=loader.describe(),
             parser=parser,
             envvar=envvar,
             expose_value=False,
-            show_default=parser != _bool,
+            show_default=not loader.is_bool,
             callback=lambda v: loader.set_value(v),
         )
         Runtime.settings[name] = (loader, option)
@@ -143,8 +207,9 @@ class Runtime:
 
     @staticmethod
     def get_config(setting: str, scope: Optional[Scope] = None) -> Optional[Any]:
-        if setting in Runtime.settings:
-            return Runtime.settings[setting][0].load_config(scope=scope)[0]
+        entry = Runtime.settings.get(setting)
+        if entry:
+            return entry[0].load_config(scope=scope)[0]
         return None
 
     @staticmethod
@@ -159,13 +224,15 @@ class Runtime:
 
     @staticmethod
     def set_value(setting: str, given: Any = None):
-        if setting in Runtime.settings:
-            return Runtime.settings[setting][0].set_value(given)
+        entry = Runtime.settings.get(setting)
+        if entry:
+            return entry[0].set_value(given)
 
     @staticmethod
     def get_value(setting: str, given: Any = None) -> Optional[Any]:
-        if setting in Runtime.settings:
-            return Runtime.settings[setting][0].get_value(given)
+        entry = Runtime.settings.get(setting)
+        if entry:
+            return entry[0].get_value(given)
         return None
 
 
@@ -217,6 +284,18 @@ class Setting(Enum):
         parser=int,
         hint="How many tokens to get at most from the model",
     )
+    TIMEOUT = Runtime.load_setting(
+        "timeout",
+        factory=60,
+        parser=int,
+        hint="How many seconds to wait at most for the model service before giving up",
+    )
+    MAX_RETRIES = Runtime.load_setting(
+        "max_retries",
+        factory=2,
+        parser=int,
+        hint="How many times to retry a failed model request before giving up",
+    )
     API_KEY = Runtime.load_setting(
         "api_key",
         envvar="GIT_LLM_API_KEY",
@@ -259,7 +338,7 @@ app = typer.Typer(
 @app.command(help="Reads the respository description")
 def description() -> Optional[str]:
     description_file = Runtime.get_value(Setting.DESCRIPTION_FILE.value)  # type: ignore
-    print(read_file(file_path=Path(Runtime.repository or ".", description_file)))  # type: ignore
+    print(read_file(file_path=(Runtime.repository or _CWD) / description_file))  # type: ignore
 
 
 @app.command(
@@ -362,6 +441,40 @@ def generate(
     )
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(
+    use_emojis: bool,
+    model_name: str,
+    model_reasoning: str | None,
+    max_tokens: int,
+    max_output_tokens: int,
+    timeout: int,
+    max_retries: int,
+    api_key: str | None,
+    api_url: str | None,
+    use_tools: bool,
+    file_path: Optional[Path],
+):
+    # litellm is expensive to import, only pay for it once we know
+    # there is something to generate; repeat calls with the same settings
+    # reuse the client (and its connection pool) for the process lifetime
+    from git_llm_utils.llm import LLMClient
+
+    return LLMClient(
+        use_emojis=use_emojis,
+        model_name=model_name,
+        model_reasoning=model_reasoning,  # type: ignore
+        max_tokens=max_tokens,
+        max_output_tokens=max_output_tokens,
+        timeout=timeout,
+        max_retries=max_retries,
+        api_key=api_key,
+        api_url=api_url,
+        use_tools=use_tools,
+        respository_description=lambda: read_file_cached(file_path),
+    )
+
+
 def _message(
     with_comments: bool | None,
     output: TextIO = typer.Option(
@@ -369,42 +482,56 @@ def _message(
     ),
     get_changes: Callable[[Optional[Path]], Optional[str]] = get_staged_changes,
 ) -> bool:
+    description_file = Runtime.get_value(Setting.DESCRIPTION_FILE.value)
+    file_path = (
+        description_file and (Runtime.repository or _CWD) / description_file or None
+    )
+    use_tools = (
+        Runtime.get_value(Setting.TOOLS.value)
+        and file_path is not None
+        and file_path.exists()
+    )
+    if use_tools:  # warm the description cache while git produces the diff
+        threading.Thread(
+            target=read_file_cached, args=(file_path,), daemon=True
+        ).start()
+
     changes = get_changes(Runtime.repository)
     if changes is None or not changes.strip():
-        print(NO_CHANGES_MESSAGE, file=output)
+        output.write(f"{NO_CHANGES_MESSAGE}\n")
         return False
 
-    description_file = Runtime.get_value(Setting.DESCRIPTION_FILE.value)
-    file_path = (
-        description_file and Path(Runtime.repository or ".", description_file) or None
-    )
-    client = LLMClient(
+    client = _get_client(
         use_emojis=Runtime.get_value(Setting.EMOJIS.value),  # type: ignore
         model_name=Runtime.get_value(Setting.MODEL.value),  # type: ignore
         model_reasoning=Runtime.get_value(Setting.MODEL_REASONING.value),
         max_tokens=Runtime.get_value(Setting.MAX_INPUT_TOKENS.value),  # type: ignore
         max_output_tokens=Runtime.get_value(Setting.MAX_OUTPUT_TOKENS.value),  # type: ignore
+        timeout=Runtime.get_value(Setting.TIMEOUT.value),  # type: ignore
+        max_retries=Runtime.get_value(Setting.MAX_RETRIES.value),  # type: ignore
         api_key=Runtime.get_value(Setting.API_KEY.value),
         api_url=Runtime.get_value(Setting.API_URL.value),
-        use_tools=Runtime.get_value(Setting.TOOLS.value)
-        and file_path is not None
-        and file_path.exists(),  # type: ignore
-        respository_description=lambda: read_file(file_path),  # type: ignore
+        use_tools=use_tools,  # type: ignore
+        file_path=file_path,
     )
     comments = Runtime.get_value(Setting.COMMENTS.value, with_comments)
 
     commented = False
-    for message in client.message(changes, stream=False):
-        if comments:
-            for c in message:
-                if not commented:
-                    print("# ", end="", file=output)
-                    commented = True
-                print(c, end="", file=output)
-                if c == "\n":
-                    commented = False
+    for message in batch_stream(client.message(changes, stream=True)):
+        if comments and message:
+            if not commented:
+                output.write("# ")
+                commented = True
+            if message.endswith("\n"):
+                # defer the next "# " until more content actually arrives
+                output.write(message[:-1].replace("\n", "\n# "))
+                output.write("\n")
+                commented = False
+            else:
+                output.write(message.replace("\n", "\n# "))
         else:
-            print(message, end="", file=output)
+            output.write(message)
+        output.flush()  # show each streamed chunk as soon as it arrives
     return True
 
 
@@ -420,6 +547,20 @@ def get_config(
         print(f"{setting.option.default} [default-value]")  # type: ignore
 
 
+@app.command(
+    help="Reads every configuration value with a single git call, avoiding one invocation per setting"
+)
+def get_all_config(scope: Optional[Scope] = None):
+    configs = _get_configs(repository=Runtime.repository, scope=scope)
+    for setting in Setting:
+        loader = Runtime.settings[setting.value][0]
+        value = configs.get(loader.key)
+        if value is not None:
+            print(f"{setting.value}={value}")
+        else:
+            print(f"{setting.value}={loader.factory} [default-value]")
+
+
 def _confirm(message: str):
     if Runtime.confirm:
         confirmed = typer.confirm(message)
@@ -450,9 +591,8 @@ def set_config(
             f"Are you sure you want to update the setting: {setting.value} from {config} to {value}?",
         )
         Runtime.set_config(setting.value, scope=scope, value=value)  # type: ignore
-        print(
-            f"Updated {setting.value} to {Runtime.get_config(setting=setting.value, scope=scope)}"
-        )
+        # --replace-all already wrote the value, no need to read it back
+        print(f"Updated {setting.value} to {value}")
     else:
         if config:
             _confirm(
@@ -474,6 +614,11 @@ def _show_version(show: bool):
 
 def _show_config(show: bool):
     if show:
+        from rich.console import Console
+        from rich.table import Table
+        from rich.markdown import Markdown
+
+        Runtime.refresh_settings()
         console = Console()
         t = Markdown("""
 - Use `git-llm-utils get-config <SETTING>` to read specific settings
@@ -496,9 +641,6 @@ By default all settings are scoped to the current respository, but you can chang
 COMMIT_ALIAS_COMMAND = typer.Option(
     help="The name of the commit alias", default=COMMIT_ALIAS
 )
-STATUS_ALIAS_COMMAND = typer.Option(
-    help="The name of the status alias", default=COMMIT_ALIAS
-)
 OVERWRITE = typer.Option(
     None,
     "--overwrite",
@@ -535,9 +677,13 @@ def install_hook(overwrite: bool = OVERWRITE):
     else:
         program_name = sys.executable
 
-    cmd = program_name.split()
-    cmd.append("--version")
-    version = execute_command(cmd)
+    if program_name == sys.executable and getattr(sys, "frozen", False):
+        # the bundled binary is the client itself, no need to spawn it again
+        version = read_version()
+    else:
+        cmd = program_name.split()
+        cmd.append("--version")
+        version = execute_command(cmd)
     if not version or read_version() not in version:
         ErrorHandler.report_error(
             "git-llm-utils version not detected, please run this command with the git-llm-utils client",
@@ -559,21 +705,19 @@ def install_hook(overwrite: bool = OVERWRITE):
             )
             raise typer.Exit(ErrorHandler.NO_GIT_REPOSITORY)
 
-    hook_template_path = (Path.cwd() / __file__).with_name(MESSAGE_HOOK_TEMPLATE)
+    hook_template_path = Path(__file__).with_name(MESSAGE_HOOK_TEMPLATE)
     _confirm(
         f"Are you sure you want to install the commit message hook in the '{Runtime.repository}' repository, using '{program_name}' command?",
     )
 
-    hook = read_file(hook_template_path)
+    hook = read_file_cached(hook_template_path)
     if hook:
         hook = hook.replace(
             "path/to/git-llm-utils",
             program_name,
         )
         hook_path = f"{Runtime.repository}/.git/hooks/{MESSAGE_HOOK}"
-        if write_file(Path(hook_path), hook, overwrite=overwrite):
-            execute_command(["chmod", "+x", hook_path])
-        else:
+        if not write_file(Path(hook_path), hook, overwrite=overwrite, mode=0o755):
             ErrorHandler.report_error(
                 f"Failed to write {MESSAGE_HOOK} to {hook_path}, use --overwrite if the hook is already installed",
                 show=True,
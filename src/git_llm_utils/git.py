@@ -1,13 +1,28 @@
 from enum import Enum
 from pathlib import Path
-from git_llm_utils.utils import execute_command, execute_raw_command, ErrorHandler
+from git_llm_utils.utils import (
+    execute_command,
+    execute_raw_command,
+    execute_status_command,
+    execute_streamed_command,
+    ErrorHandler,
+)
 from typing import Optional, Tuple
 
+import functools
+import os
+import re
+import shutil
 import sys
 import tempfile
+import threading
 
+# resolved once so execve skips the PATH walk on every invocation
+GIT = shutil.which("git") or "git"
 _VALID_EXIT_CODES = [0]
 COMMIT_MESSAGE_TEMPLATE = "commit-msg.template"
+# non-blank lines whose first meaningful character is not a comment marker
+_MESSAGE_LINE = re.compile(r"^[ \t]*([^#\s][^\r\n]*?)[ \t\r]*$", re.MULTILINE)
 
 
 class Scope(Enum):
@@ -16,6 +31,11 @@ class Scope(Enum):
     LOCAL = "local"  # use repository config file
 
 
+# static argv prefixes per scope, built once instead of per call
+_CONFIG_PREFIX: dict = {scope: [GIT, "config", f"--{scope.value}"] for scope in Scope}
+_CONFIG_PREFIX[None] = [GIT, "config"]
+
+
 def get_config(
     key: str,
     default_value: str | None = None,
@@ -25,15 +45,53 @@ def get_config(
     namespace: str = "git-llm-utils",
     valid_codes=_VALID_EXIT_CODES,
 ) -> Optional[str]:
+    value = get_configs(
+        repository=repository,
+        scope=scope,
+        abort_on_error=abort_on_error,
+        namespace=namespace,
+    ).get(key)
+    return value if value is not None else default_value
+
+
+@functools.lru_cache(maxsize=16)
+def _load_namespace(
+    repository: Optional[str | Path],
+    scope: Optional[Scope],
+    abort_on_error: bool,
+    namespace: str,
+) -> dict[str, str]:
+    # -z null-delimits the records so values containing newlines survive
+    command = _CONFIG_PREFIX[scope] + ["-z", "--get-regexp", f"^{namespace}\\."]
     output = execute_command(
-        scope is not None
-        and ["git", "config", "--get", f"--{scope.value}", f"{namespace}.{key}"]
-        or ["git", "config", "--get", f"{namespace}.{key}"],
+        command,
         cwd=repository,
         abort_on_error=abort_on_error,
-        valid_codes=valid_codes,
+        valid_codes=[0, 1],  # 1 means there are no matching keys
     )
-    return output and str.strip(output) or default_value
+    configs = {}
+    prefix = f"{namespace}."
+    if output:
+        for record in output.split("\0"):
+            (key, _, value) = record.partition("\n")
+            if key.startswith(prefix):
+                configs[key[len(prefix) :]] = value
+    return configs
+
+
+def get_configs(
+    repository: Optional[str | Path] = None,
+    scope: Optional[Scope] = None,
+    abort_on_error: bool = False,
+    namespace: str = "git-llm-utils",
+) -> dict[str, str]:
+    """
+    Reads every configuration value in the namespace with a single git call,
+    memoized per (repository, scope) until a configuration write happens
+    Returns:
+        dict[str, str]: the configured key/value pairs, empty if there are none
+    """
+    return _load_namespace(repository, scope, abort_on_error, namespace)
 
 
 def set_config(
@@ -45,19 +103,20 @@ def set_config(
     namespace: str = "git-llm-utils",
     valid_codes=_VALID_EXIT_CODES,
 ):
-    execute_command(
-        [
-            "git",
-            "config",
-            f"--{scope.value}",
-            "--replace-all",
-            f"{namespace}.{key}",
-            f"{value}",
-        ],
-        cwd=repository,
-        abort_on_error=abort_on_error,
-        valid_codes=valid_codes,
-    )
+    command = _CONFIG_PREFIX[scope] + [
+        "--replace-all",
+        f"{namespace}.{key}",
+        f"{value}",
+    ]
+    # the output is never read, skip the capture pipes entirely
+    status = execute_status_command(command, cwd=repository)
+    if status not in valid_codes:
+        if abort_on_error:
+            raise Exception(f"Failed to execute command (status:{status}): {command}")
+        ErrorHandler.report_error(
+            f"Failed to execute command (status:{status}): {command}"
+        )
+    _load_namespace.cache_clear()  # the cached values are stale after a write
 
 
 def unset_config(
@@ -66,60 +125,95 @@ def unset_config(
     abort_on_error: bool = True,
     repository: Optional[str | Path] = None,
 ):
-    execute_command(
-        ["git", "config", f"--{scope.value}", "--unset", f"git-llm-utils.{key}"],
-        cwd=repository,
-        abort_on_error=abort_on_error,
-        valid_codes=_VALID_EXIT_CODES,
-    )
+    command = _CONFIG_PREFIX[scope] + ["--unset", f"git-llm-utils.{key}"]
+    status = execute_status_command(command, cwd=repository)
+    if status not in _VALID_EXIT_CODES:
+        if abort_on_error:
+            raise Exception(f"Failed to execute command (status:{status}): {command}")
+        ErrorHandler.report_error(
+            f"Failed to execute command (status:{status}): {command}"
+        )
+    _load_namespace.cache_clear()  # the cached values are stale after a write
 
 
 def get_staged_changes(
     repository: Optional[str | Path] = None, abort_on_error: bool = True
 ) -> Optional[str]:
     """
-    Generate diff message from the staged changes
+    Generate diff message from the staged changes, reading the git output
+    as it is produced instead of buffering the full diff first
     Returns:
         Optional[str]: the changes or empty if there weren't any
     """
-    return execute_command(
-        ["git", "diff", "--staged", "."],
-        cwd=repository,
-        abort_on_error=abort_on_error,
-        valid_codes=_VALID_EXIT_CODES,
+    if (
+        execute_status_command(
+            [GIT, "diff", "--staged", "--quiet", "."], cwd=repository
+        )
+        == 0
+    ):  # 0 means there is nothing staged, skip materializing the diff
+        return None
+    return (
+        "".join(
+            execute_streamed_command(
+                [GIT, "diff", "--staged", "."],
+                cwd=repository,
+                abort_on_error=abort_on_error,
+                valid_codes=_VALID_EXIT_CODES,
+            )
+        )
+        or None
     )
 
 
+@functools.lru_cache(maxsize=16)
 def get_repository_path(
     repository: Optional[str | Path] = None, abort_on_error: bool = True
 ) -> Optional[Path]:
     repository_path = None
-    if not repository:
+    try:
         repository_path = execute_command(
-            ["git", "rev-parse", "--show-toplevel"], abort_on_error=abort_on_error
+            [GIT, "rev-parse", "--show-toplevel"],
+            cwd=repository or None,
+            abort_on_error=abort_on_error,
         )
-    else:
-        rp = Path(repository)
-        if rp.exists() and rp.is_dir():
-            repository_path = execute_command(
-                ["git", "rev-parse", "--show-toplevel"],
-                cwd=repository,
-                abort_on_error=abort_on_error,
-            )
+    except OSError:  # the given path is missing or not a directory
+        pass
 
     if repository and not repository_path:
         print(f"No git repository detected in the {repository} folder", file=sys.stderr)
         sys.exit(-1)
 
-    return repository_path and Path(str(repository_path).strip()) or None
+    return Path(str(repository_path).strip()) if repository_path else None
+
+
+@functools.lru_cache(maxsize=1)
+def _commit_msg_template() -> str:
+    # the template is a static package resource, read it once per process;
+    # resolved next to __file__ so the pyinstaller bundle finds it too
+    return Path(__file__).with_name(COMMIT_MESSAGE_TEMPLATE).read_text()
 
 
 def get_repository_changes(
     repository: Optional[str | Path] = None, abort_on_error: bool = True
 ) -> Tuple[str | None, str | None]:
-    branch = execute_command(["git", "branch", "--show-current"], cwd=repository)
-    changeset = execute_command(["git", "status", "--porcelain"], cwd=repository)
-    return branch, changeset
+    # the two queries are independent, overlap their process startup
+    result: dict = {}
+
+    def _branch():
+        try:
+            result["branch"] = execute_command(
+                [GIT, "branch", "--show-current"], cwd=repository
+            )
+        except Exception as e:  # surface the failure in the calling thread
+            result["error"] = e
+
+    thread = threading.Thread(target=_branch)
+    thread.start()
+    changeset = execute_command([GIT, "status", "--porcelain"], cwd=repository)
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result.get("branch"), changeset
 
 
 def request_message_edit(
@@ -128,29 +222,28 @@ def request_message_edit(
     repository: Optional[str | Path] = None,
     abort_on_error: bool = True,
 ) -> str | None:
-    file = tempfile.NamedTemporaryFile()
-    file.write("\n".encode())
-    file.write(message.encode())
     (branch, changeset) = get_repository_changes(
         repository=repository, abort_on_error=abort_on_error
     )
     if branch is not None and changeset is not None:
         branch = branch.strip()
-        commit_msg_template_path = (Path.cwd() / __file__).with_name(
-            COMMIT_MESSAGE_TEMPLATE
-        )
-        for line in open(commit_msg_template_path):
-            file.write(line.replace("{BRANCH}", branch).encode())
-        for change in changeset.split("\n"):
-            file.write(f"# \t{change}\n".encode())
-        file.flush()
-        execute_raw_command([editor, file.name])
-        file.seek(0)
-        lines = [
-            s_line
-            for line in file.readlines()
-            if not (s_line := line.decode().strip()).startswith("#") and len(s_line) > 0
+        # build the whole editor buffer and write it in one call
+        content = [
+            "\n",
+            message,
+            _commit_msg_template().replace("{BRANCH}", branch),
         ]
+        content.extend(f"# \t{change}\n" for change in changeset.split("\n"))
+        (fd, path) = tempfile.mkstemp()
+        try:
+            os.write(fd, "".join(content).encode())
+        finally:
+            os.close(fd)  # the editor needs the closed, fully written file
+        try:
+            execute_raw_command([editor, path])
+            lines = _MESSAGE_LINE.findall(Path(path).read_text())
+        finally:
+            os.unlink(path)
         ErrorHandler.report_debug(f"message update lines are: {lines}")
         if len(lines) > 0:
             return "\n".join(lines)
@@ -298,6 +298,12 @@ class LLMClient(BaseModel):
     max_iterations: int = Field(
         description="How many tools interation to perform at most", default=5
     )
+    timeout: int = Field(
+        description="How many seconds to wait at most for a response", default=60
+    )
+    max_retries: int = Field(
+        description="How many times to retry a failed request at most", default=2
+    )
     respository_description: Callable[[], str] | None = Field(
         description="a human readable description of the repository", default=None
     )
@@ -354,20 +360,31 @@ class LLMClient(BaseModel):
         incomplete = True
         interaction = 1
         while incomplete:
+            active_tools = interaction < self.max_iterations and tools or []
+            streaming = stream and not active_tools  # tool calls need full responses
             response = litellm.completion(
                 model=f"{self.model_name}",
                 messages=messages,
-                tools=interaction < self.max_iterations and tools or [],
+                tools=active_tools,
                 tool_choice="auto",
                 base_url=self.api_url,
                 api_key=self.api_key,
                 max_tokens=self.max_output_tokens,
-                stream=False,
+                timeout=self.timeout,  # a hung endpoint must not block the hook
+                num_retries=self.max_retries,
+                stream=streaming,
                 reasoning_effort=self.model_reasoning,
                 drop_params=True,  # cross llm provider support
                 temperature=self.model_temperature,
                 verbosity="medium",
             )
+            if streaming:
+                incomplete = False
+                for chunk in response:  # type: ignore
+                    content = chunk.choices[0]["delta"]["content"]  # type: ignore
+                    if content:
+                        yield content
+                continue
             response_message = response.choices[0]["message"]  # type: ignore
             tool_calls = response.choices[0]["message"]["tool_calls"]  # type: ignore
             if tool_calls:
@@ -392,8 +409,4 @@ class LLMClient(BaseModel):
                     )
             else:
                 incomplete = False
-                if stream:
-                    for res in response.choices[0]["message"]["content"]:  # type: ignore
-                        yield res
-                else:
-                    yield response.choices[0]["message"]["content"]  # type: ignore
+                yield response.choices[0]["message"]["content"]  # type: ignore
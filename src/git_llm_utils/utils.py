@@ -1,17 +1,32 @@
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
+import codecs
+import functools
 import git_llm_utils
 import os
+import queue
 import subprocess
 import sys
+import threading
+import time
 import tomllib
 
 
+# resolved once instead of per subprocess call
+_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+
+_TRUE = frozenset(("1", "true", "True", "TRUE", "yes", "Yes", "YES"))
+
+
 def _bool(value: Optional[str | Any]) -> bool:
     if type(value) is bool:
         return value
-    return value and value.lower() in ("1", "true", "yes") or False
+    if isinstance(value, str):
+        # common spellings skip the lowercase allocation
+        return value in _TRUE or value.lower() in _TRUE
+    return False  # anything else (None, numbers, ...) is not truthy here
 
 
 class ErrorHandler:
@@ -77,15 +92,12 @@ def execute_command(
     try:
         result = subprocess.run(
             command,
-            capture_output=True,
-            text=True,
+            capture_output=True,  # text mode is skipped to avoid wrapper setup
             check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
-            encoding="utf-8",
-            errors="replace",
+            creationflags=_CREATIONFLAGS,
             cwd=cwd,
         )
-        return result.stdout
+        return result.stdout.decode("utf-8", errors="replace")
     except subprocess.CalledProcessError as e:
         if e.returncode not in valid_codes:
             if abort_on_error:
@@ -98,6 +110,71 @@ def execute_command(
     return None
 
 
+def execute_status_command(
+    command: Union[list[str], str],
+    cwd: Optional[str | Path] = None,
+) -> int:
+    """
+    Executes the command returning only its exit status, skipping all of the
+    output capture and decoding work
+    """
+    ErrorHandler.report_debug(f"Will run status command: {command}")
+    return subprocess.run(
+        command,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=_CREATIONFLAGS,
+    ).returncode
+
+
+def execute_streamed_command(
+    command: Union[list[str], str],
+    abort_on_error: bool = True,
+    cwd: Optional[str | Path] = None,
+    valid_codes: Iterable[int] = [0],
+    chunk_size: int = 1 << 16,
+):
+    """
+    Executes the command yielding decoded chunks of its output while it runs,
+    avoiding buffering the full output before the caller can consume it
+    """
+    ErrorHandler.report_debug(f"Will stream command: {command}")
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=_CREATIONFLAGS,
+    )
+    # stderr is drained on a thread so a chatty child cannot fill the pipe
+    # and deadlock against our stdout reads; the text feeds error reports
+    stderr_chunks: list[bytes] = []
+    drain = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),  # type: ignore
+        daemon=True,
+    )
+    drain.start()
+    # the incremental decoder keeps multi-byte characters split across
+    # chunk boundaries intact
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while chunk := process.stdout.read(chunk_size):  # type: ignore
+        if text := decoder.decode(chunk):
+            yield text
+    if text := decoder.decode(b"", True):
+        yield text
+    drain.join()
+    if process.wait() not in valid_codes:
+        error = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+        if abort_on_error:
+            raise Exception(
+                f"Failed to stream command (status:{process.returncode}): {command} -> {error}"
+            )
+        ErrorHandler.report_error(
+            f"Failed to stream command (status:{process.returncode}): {command} -> {error}"
+        )
+
+
 def execute_raw_command(
     command: Union[list[str], str],
     input: Any | None = None,
@@ -109,7 +186,7 @@ def execute_raw_command(
         capture_output=False,
         text=True,
         check=True,
-        creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        creationflags=_CREATIONFLAGS,
         encoding="utf-8",
         errors="replace",
         cwd=cwd,
@@ -117,6 +194,53 @@ def execute_raw_command(
     )
 
 
+def batch_stream(
+    iterator: Iterator[str], max_items: int = 32, max_ms: int = 50
+) -> Iterator[str]:
+    """
+    Groups items pulled from a blocking iterator into joined batches, draining
+    up to max_items or max_ms at a time, so fast producers do not pay the
+    per-item output overhead downstream
+    """
+    done = object()
+    items: queue.Queue = queue.Queue()
+
+    def _pull():
+        try:
+            for item in iterator:
+                items.put(item)
+        except Exception as e:
+            items.put(e)
+        items.put(done)
+
+    threading.Thread(target=_pull, daemon=True).start()
+    window = max_ms / 1000
+    while True:
+        item = items.get()
+        if item is done:
+            return
+        if isinstance(item, Exception):
+            raise item
+        batch = [item]
+        deadline = time.monotonic() + window
+        while len(batch) < max_items:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = items.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is done:
+                yield "".join(batch)
+                return
+            if isinstance(item, Exception):
+                raise item
+            batch.append(item)
+        yield "".join(batch)
+
+
+@functools.lru_cache(maxsize=1)
 def get_tomlib_project() -> Dict:
     try:
         with open(Path("pyproject.toml"), mode="rb") as f:
@@ -128,23 +252,61 @@ def get_tomlib_project() -> Dict:
 
 
 def read_file(file_path: Path | None) -> Optional[str]:
-    if file_path is not None and file_path.exists():
-        try:
-            with open(file_path, "r") as file:
-                return file.read()
-        except Exception as e:
-            ErrorHandler.report_error(f"Failed to read {file_path}: {e}")
-    else:
+    if file_path is None:
         ErrorHandler.report_error(f"File {file_path} does not exist")
+        return None
+    try:  # open directly, the exists() probe would just double the syscalls
+        with open(file_path, "r") as file:
+            return file.read()
+    except (FileNotFoundError, IsADirectoryError):
+        ErrorHandler.report_error(f"File {file_path} does not exist")
+    except Exception as e:
+        ErrorHandler.report_error(f"Failed to read {file_path}: {e}")
     return None
 
 
-def write_file(file_path: Path, content: str = "", overwrite: bool = False) -> bool:
-    if not file_path.exists() or overwrite:
+@functools.lru_cache(maxsize=8)
+def _read_file_cached(file_path: str, mtime_ns: int) -> str:
+    with open(file_path, "r") as file:
+        return file.read()
+
+
+def read_file_cached(file_path: Path | None) -> Optional[str]:
+    """
+    Reads the file through a cache keyed by path and modification time, so
+    repeated reads (e.g. llm tool calls) skip the filesystem until it changes
+    """
+    if file_path is None:
+        ErrorHandler.report_error(f"File {file_path} does not exist")
+        return None
+    try:  # the cache key stat doubles as the existence probe
+        return _read_file_cached(str(file_path), file_path.stat().st_mtime_ns)
+    except (FileNotFoundError, IsADirectoryError):
+        ErrorHandler.report_error(f"File {file_path} does not exist")
+    except Exception as e:
+        ErrorHandler.report_error(f"Failed to read {file_path}: {e}")
+    return None
+
+
+def write_file(
+    file_path: Path,
+    content: str = "",
+    overwrite: bool = False,
+    mode: int | None = None,
+) -> bool:
+    existed = file_path.exists()
+    if not existed or overwrite:
         try:
-            with open(file_path, "w") as file:
+            # when a mode is given the file is created with it directly,
+            # skipping a separate chmod; pre-existing files still need one
+            opener = mode is not None and (
+                lambda path, flags: os.open(path, flags, mode)
+            )
+            with open(file_path, "w", opener=opener or None) as file:
                 file.write(content)
-                return True
+            if mode is not None and existed:
+                os.chmod(file_path, mode)
+            return True
         except Exception as e:
             ErrorHandler.report_error(f"Failed to write {file_path}: {e}")
     else:
@@ -154,6 +316,7 @@ def write_file(file_path: Path, content: str = "", overwrite: bool = False) -> b
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def read_version() -> str:
     try:
         return git_llm_utils.__version__
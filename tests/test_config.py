@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+sys.path.append("src")
+
+from types import SimpleNamespace
+from typing import Any
+from git_llm_utils import app
+from git_llm_utils.git import _load_namespace, get_config, get_configs
+
+
+def _mock_configs(monkeypatch, output: str | Any = None, status: int = 0):
+    def _run(*args, **kwargs):
+        if status != 0:
+            raise subprocess.CalledProcessError(status, args[0])
+        return SimpleNamespace(stdout=(output or "").encode(), returncode=status)
+
+    monkeypatch.setattr(subprocess, "run", _run)
+    _load_namespace.cache_clear()  # isolate the memoized scan between tests
+
+
+def test_get_configs_parses_null_delimited_records(monkeypatch):
+    _mock_configs(
+        monkeypatch,
+        "git-llm-utils.model\ntest-model\0git-llm-utils.multi\nline1\nline2\0",
+    )
+    configs = get_configs()
+    assert configs == {"model": "test-model", "multi": "line1\nline2"}
+
+
+def test_get_configs_ignores_foreign_namespaces(monkeypatch):
+    _mock_configs(monkeypatch, "alias.llmc\ncommit\0git-llm-utils.model\ntest\0")
+    assert get_configs() == {"model": "test"}
+
+
+def test_get_configs_with_no_keys(monkeypatch):
+    _mock_configs(monkeypatch, status=1)  # git exits 1 when nothing matches
+    assert get_configs() == {}
+
+
+def test_get_config_empty_value_wins_over_default(monkeypatch):
+    _mock_configs(monkeypatch, "git-llm-utils.editor\n\0")
+    assert get_config("editor", default_value="vim") == ""
+
+
+def test_get_config_missing_key_falls_back(monkeypatch):
+    _mock_configs(monkeypatch, status=1)
+    assert get_config("editor", default_value="vim") == "vim"
+
+
+def test_get_all_config_lists_values_and_defaults(monkeypatch, capsys):
+    monkeypatch.setattr(app, "_get_configs", lambda **kwargs: {"model": "test-model"})
+    app.Runtime.repository = None
+    app.get_all_config()
+    out = capsys.readouterr().out
+    assert "model=test-model\n" in out
+    assert f"emojis={app.Setting.EMOJIS.factory} [default-value]\n" in out
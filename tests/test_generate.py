@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 import subprocess
 import sys
 
@@ -11,10 +11,23 @@ from git_llm_utils.llm import LLMClient
 
 
 def _mock_changes(monkeypatch, changes: str | Any):
+    staged = changes and 1 or 0  # git diff --quiet exit code semantics
+
     def _changes(*args, **kwargs):
-        return SimpleNamespace(stdout=changes)
+        if "--quiet" in args[0]:
+            return SimpleNamespace(stdout=b"", returncode=staged)
+        return SimpleNamespace(stdout=(changes or "").encode())
+
+    def _streamed_changes(*args, **kwargs):
+        return SimpleNamespace(
+            stdout=BytesIO((changes or "").encode()),
+            stderr=BytesIO(b""),
+            wait=lambda: 0,
+            returncode=0,
+        )
 
     monkeypatch.setattr(subprocess, "run", _changes)
+    monkeypatch.setattr(subprocess, "Popen", _streamed_changes)
 
 
 def _mock_message(monkeypatch, message: str | Any):